@@ -0,0 +1,64 @@
+"""
+PREPROCESSING PIPELINE RUNNER
+=============================
+Runs the numbered Data_Engineering steps in order inside ONE interpreter.
+Each step is executed with runpy as if launched with `python <script>`, so
+pandas / numpy / pyarrow are imported once for the whole pipeline instead
+of once per script.
+
+Step 6 (MIDAS similarity check) is a manual diagnostic and is not included.
+The steps depend on each other's outputs, so they run sequentially.
+
+Run from the Data_Engineering directory (same level as the Data folder).
+"""
+
+import os
+import sys
+import runpy
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# =====================================================================
+# STEP CONTROL - Comment out steps that have already completed
+# =====================================================================
+STEPS = [
+    "1_dmi_combine_raw_years.py",
+    "2_standardize_csv_formats.py",
+    "3_parse_dmi_weather.py",
+    "4_clean_and_validate_data.py",
+    "5_align_and_split.py",
+    "7_enforce_strict_boundaries.py",
+    "8_audit_timestamp_boundaries.py",
+    "9_build_master_features.py",
+    "10_verify_sequential_order.py",
+    "11_generate_horizon_matrices.py",
+]
+
+# =====================================================================
+# HELPERS
+# =====================================================================
+
+def print_step(script):
+    print("\n" + "=" * 60)
+    print(f"  STEP: {script}")
+    print("=" * 60)
+
+def run_step(script):
+    """Executes a step script in-process with __name__ == '__main__'."""
+    runpy.run_path(os.path.join(SCRIPT_DIR, script), run_name="__main__")
+
+# =====================================================================
+# MAIN
+# =====================================================================
+if __name__ == "__main__":
+    for script in STEPS:
+        print_step(script)
+        try:
+            run_step(script)
+            print(f"\n  [{script} COMPLETE]")
+        except Exception as e:
+            print(f"\n  [{script} FAILED] {e}")
+            print("  Fix the error above before continuing.")
+            sys.exit(1)
+
+    print("\nPreprocessing pipeline complete.")
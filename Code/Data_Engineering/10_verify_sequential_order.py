@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -7,31 +8,37 @@ from pathlib import Path
 BASE_PATH = Path("Data")
 ML_DATA_DIR = BASE_PATH / "ML_Ready_Data"
 
+HOUR_NS = 3_600_000_000_000
+
 def verify_timeline(file_path):
     print(f"\nAnalyzing: {file_path.name}")
     
     # We only need the timestamp column for this check (super fast)
     df = pd.read_csv(file_path, usecols=['HourUTC'])
-    df['HourUTC'] = pd.to_datetime(df['HourUTC'])
+    df['HourUTC'] = pd.to_datetime(df['HourUTC'], format='ISO8601')
+    
+    # One int64 diff array (ns) feeds every check below
+    ts = df['HourUTC'].to_numpy(dtype='datetime64[ns]').view('int64')
+    time_diffs = np.diff(ts)
     
     # 1. Monotonic Check (Strictly forward in time?)
-    is_monotonic = df['HourUTC'].is_monotonic_increasing
+    is_monotonic = bool((time_diffs >= 0).all())
     print(f"  -> Strictly Sequential: {'[PASS]' if is_monotonic else '[FAIL] Backward jumps detected!'}")
     
-    # 2. Duplicate Check
-    duplicates = df['HourUTC'].duplicated().sum()
+    # 2. Duplicate Check (repeats are adjacent once sorted)
+    sorted_diffs = time_diffs if is_monotonic else np.diff(np.sort(ts))
+    duplicates = int((sorted_diffs == 0).sum())
     print(f"  -> Duplicate Timestamps: {duplicates} {'[PASS]' if duplicates == 0 else '[FAIL]'}")
     
     # 3. Continuity Check (Exactly 1-hour steps?)
-    time_diffs = df['HourUTC'].diff().dropna()
-    gaps = (time_diffs != pd.Timedelta(hours=1)).sum()
+    gaps = int((time_diffs != HOUR_NS).sum())
     
     if gaps == 0:
         print("  -> Continuous 1-Hour Steps: [PASS] (No missing hours!)")
     else:
         print(f"  -> Continuity Warning: Found {gaps} jumps that are NOT exactly 1 hour.")
         # If there are gaps, let's print the biggest one so you know how bad it is
-        max_gap = time_diffs.max()
+        max_gap = pd.Timedelta(int(time_diffs.max()), unit='ns')
         print(f"     Largest single gap: {max_gap}")
 
 def main():
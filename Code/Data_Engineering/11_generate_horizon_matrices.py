@@ -29,7 +29,7 @@ def main():
         
         # Sort by time to ensure shifting operations are mathematically sound
         if 'HourUTC' in df_base.columns:
-            df_base['HourUTC'] = pd.to_datetime(df_base['HourUTC'])
+            df_base['HourUTC'] = pd.to_datetime(df_base['HourUTC'], format='ISO8601')
             df_base = df_base.sort_values('HourUTC').reset_index(drop=True)
             
         # Determine the base price column to use for shifting
@@ -37,24 +37,30 @@ def main():
         
         for h in horizons:
             print(f"  Generating Master Matrix for Horizon: {h}h...")
-            df_h = df_base.copy()
             
             target_price_col = f'TARGET_Price_{h}h'
             target_delta_col = f'TARGET_Delta_{h}h'
             
             # Shift the target price backward by 'h' rows to simulate the future
-            df_h[target_price_col] = df_h[price_col].shift(-h)
+            target_price = df_base[price_col].shift(-h)
             
             # Delta = Future Price - Current Price
-            df_h[target_delta_col] = df_h[target_price_col] - df_h[price_col]
+            target_delta = target_price - df_base[price_col]
             
             # Shifting introduces NaN values at the very end of the dataset. Drop them.
-            df_h = df_h.dropna(subset=[target_price_col, target_delta_col]).reset_index(drop=True)
+            valid_rows = (target_price.notna() & target_delta.notna()).to_numpy()
+            
+            # Attach the targets to the base frame temporarily instead of copying it per horizon;
+            # the row selection below is then the only full-width allocation
+            df_base[target_price_col] = target_price
+            df_base[target_delta_col] = target_delta
             
             # Save the specific horizon matrix
             output_file = base_dir / f"Master_Matrix_{region}_Horizon{h}h.csv"
-            df_h.to_csv(output_file, index=False)
-            print(f"    -> Saved {output_file.name} | Total Rows: {len(df_h)}")
+            df_base[valid_rows].to_csv(output_file, index=False)
+            print(f"    -> Saved {output_file.name} | Total Rows: {int(valid_rows.sum())}")
+            
+            df_base.drop(columns=[target_price_col, target_delta_col], inplace=True)
             
     print("\n--------------------------------------------------")
     print("ALL HORIZON MATRICES GENERATED SUCCESSFULLY")
@@ -1,4 +1,6 @@
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ==========================================
@@ -10,6 +12,38 @@ BASE_PATH = Path("Data/DMI")
 RAW_DIR = BASE_PATH / "YearlyRaw"
 COMBINED_DIR = BASE_PATH / "CombinedYearlyRaw"
 
+# 1 MiB chunks for the raw byte copy
+COPY_BUFFER_SIZE = 1024 * 1024
+
+def combine_year(year_folder):
+    """Concatenates one year's daily files into a single yearly file."""
+    year = year_folder.name
+    output_filepath = COMBINED_DIR / f"{year}.txt"
+    
+    # Get all daily text files in this folder, sorted chronologically
+    daily_files = sorted(year_folder.glob("*.txt"))
+    
+    if not daily_files:
+        print(f"Skipping {year}: No text files found.")
+        return
+        
+    print(f"Processing year {year}... ({len(daily_files)} files found)")
+    
+    # Open the output file in binary write mode (pure concatenation, no decoding needed)
+    with open(output_filepath, 'wb', buffering=COPY_BUFFER_SIZE) as outfile:
+        for daily_file in daily_files:
+            with open(daily_file, 'rb', buffering=COPY_BUFFER_SIZE) as infile:
+                # Chunked copy in C keeps memory flat regardless of file size
+                shutil.copyfileobj(infile, outfile, COPY_BUFFER_SIZE)
+
+                # Ensure we don't end up with concatenated lines if a file lacks a trailing newline
+                if infile.tell() > 0:
+                    infile.seek(-1, os.SEEK_END)
+                    if infile.read(1) != b'\n':
+                        outfile.write(b'\n')
+                        
+    print(f"Successfully created: {output_filepath}")
+
 def combine_dmi_yearly_data():
     print("Starting DMI raw data consolidation...")
     
@@ -29,33 +63,9 @@ def combine_dmi_yearly_data():
         print(f"No yearly folders found in {RAW_DIR}")
         return
 
-    # 3. Iterate through each year and combine its daily files
-    for year_folder in year_folders:
-        year = year_folder.name
-        output_filepath = COMBINED_DIR / f"{year}.txt"
-        
-        # Get all daily text files in this folder, sorted chronologically
-        daily_files = sorted(year_folder.glob("*.txt"))
-        
-        if not daily_files:
-            print(f"Skipping {year}: No text files found.")
-            continue
-            
-        print(f"Processing year {year}... ({len(daily_files)} files found)")
-        
-        # 4. Open the output file in write mode
-        with open(output_filepath, 'w', encoding='utf-8') as outfile:
-            for daily_file in daily_files:
-                # Open each daily file in read mode
-                with open(daily_file, 'r', encoding='utf-8') as infile:
-                    # Write line-by-line to handle large files efficiently without memory crashes
-                    for line in infile:
-                        # Ensure we don't end up with concatenated lines if a file lacks a trailing newline
-                        outfile.write(line)
-                        if not line.endswith('\n'):
-                            outfile.write('\n')
-                            
-        print(f"Successfully created: {output_filepath}")
+    # 3. Combine each year independently (I/O-bound, so threads are enough)
+    with ThreadPoolExecutor(max_workers=min(len(year_folders), os.cpu_count() or 1)) as executor:
+        list(executor.map(combine_year, year_folders))
 
     print("\nConsolidation complete. All yearly files are ready in Data/DMI/CombinedYearlyRaw/")
 
@@ -15,9 +15,35 @@ CSV_FILES = [
 
 STANDARD_UTC_HEADER = "HourUTC"
 
+# Rows buffered per writer.writerows() call
+WRITE_BATCH_ROWS = 10000
+
+# 1 MiB file buffers: fewer read/write syscalls on the multi-GB exports
+IO_BUFFER_SIZE = 1024 * 1024
+
+# Trailing 'Z' or +HH:MM / +HHMM offset
+TZ_SUFFIX_PATTERN = re.compile(r'(Z|[+-]\d{2}:?\d{2})$')
+
+# European decimal such as '-12,34'
+COMMA_DECIMAL_PATTERN = re.compile(r'^-?\d+,\d+$')
+
+# Every hour repeats once per PriceArea, so each raw timestamp is only formatted once
+_utc_timestamp_cache = {}
+
 def format_utc_timestamp(ts):
     """Converts '2026-03-24 22:45:00' to '2026-03-24T22:45:00+00:00'"""
+    cached = _utc_timestamp_cache.get(ts)
+    if cached is not None:
+        return cached
+
+    raw_ts = ts
     ts = ts.strip()
+
+    # Fast path: already strict ISO-8601 UTC, nothing to rewrite
+    if ts.endswith("+00:00") and " " not in ts:
+        _utc_timestamp_cache[raw_ts] = ts
+        return ts
+
     if not ts:
         return ts
     
@@ -26,11 +52,33 @@ def format_utc_timestamp(ts):
         ts = ts.replace(" ", "T")
         
     # If it lacks a timezone offset, force append strict UTC
-    if not re.search(r'(Z|[+-]\d{2}:?\d{2})$', ts):
+    if not TZ_SUFFIX_PATTERN.search(ts):
         ts += "+00:00"
-        
+
+    _utc_timestamp_cache[raw_ts] = ts
     return ts
 
+def clean_ragged_row(row, dk_col_idx, utc_col_idx, uses_comma_decimals):
+    """Per-field cleanup for rows whose length differs from the header (incl. blank rows)."""
+    cleaned_row = []
+    for i, val in enumerate(row):
+        # Skip the DK local time column entirely
+        if i == dk_col_idx:
+            continue
+
+        val = val.strip()
+
+        # Apply strict ISO-8601 formatting to the UTC column
+        if i == utc_col_idx:
+            val = format_utc_timestamp(val)
+
+        # Fix European decimals
+        elif uses_comma_decimals and ',' in val and COMMA_DECIMAL_PATTERN.match(val):
+            val = val.replace(',', '.')
+
+        cleaned_row.append(val)
+    return cleaned_row
+
 def analyze_and_standardize():
     print("Starting CSV Format & Timestamp Standardization...")
     print("-" * 60)
@@ -62,7 +110,7 @@ def analyze_and_standardize():
         output_name = file_path.stem + "_standardized.csv"
         output_path = file_path.parent / output_name 
         
-        with open(file_path, 'r', encoding='utf-8') as infile:
+        with open(file_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as infile:
             reader = csv.reader(infile, delimiter=detected_delimiter)
             
             try:
@@ -86,33 +134,45 @@ def analyze_and_standardize():
             # Create new headers without the DK column
             final_headers = [h for i, h in enumerate(headers) if i != dk_col_idx]
 
+            # Resolve column positions once so the row loop is plain index access
+            n_cols = len(headers)
+            keep_idx = [i for i in range(n_cols) if i != dk_col_idx]
+            out_utc_idx = keep_idx.index(utc_col_idx) if utc_col_idx != -1 else -1
+            decimal_idx = [j for j, i in enumerate(keep_idx) if i != utc_col_idx] if uses_comma_decimals else []
+
             # Write Standardized Output
-            with open(output_path, 'w', encoding='utf-8', newline='') as outfile:
+            with open(output_path, 'w', encoding='utf-8', newline='', buffering=IO_BUFFER_SIZE) as outfile:
                 writer = csv.writer(outfile, delimiter=',')
                 writer.writerow(final_headers)
                 
                 rows_processed = 0
+                batch = []
                 for row in reader:
-                    cleaned_row = []
-                    for i, val in enumerate(row):
+                    # The precomputed positions assume a full-width row
+                    if len(row) != n_cols:
+                        cleaned_row = clean_ragged_row(row, dk_col_idx, utc_col_idx, uses_comma_decimals)
+                    else:
                         # Skip the DK local time column entirely
-                        if i == dk_col_idx:
-                            continue
-                            
-                        val = val.strip()
-                        
+                        cleaned_row = [row[i].strip() for i in keep_idx]
+
                         # Apply strict ISO-8601 formatting to the UTC column
-                        if i == utc_col_idx:
-                            val = format_utc_timestamp(val)
-                        
-                        # Fix European decimals
-                        elif uses_comma_decimals and re.match(r'^-?\d+,\d+$', val):
-                            val = val.replace(',', '.')
-                            
-                        cleaned_row.append(val)
-                        
-                    writer.writerow(cleaned_row)
-                    rows_processed += 1
+                        if out_utc_idx != -1:
+                            cleaned_row[out_utc_idx] = format_utc_timestamp(cleaned_row[out_utc_idx])
+
+                        # Fix European decimals (values without a comma pass through untouched)
+                        for j in decimal_idx:
+                            val = cleaned_row[j]
+                            if ',' in val and COMMA_DECIMAL_PATTERN.match(val):
+                                cleaned_row[j] = val.replace(',', '.')
+
+                    batch.append(cleaned_row)
+                    if len(batch) >= WRITE_BATCH_ROWS:
+                        writer.writerows(batch)
+                        rows_processed += len(batch)
+                        batch = []
+
+                writer.writerows(batch)
+                rows_processed += len(batch)
 
         print(f"  -> Converted {rows_processed} rows.")
         print("  -> European decimals converted to standard periods.")
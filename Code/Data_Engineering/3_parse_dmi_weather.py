@@ -1,6 +1,9 @@
 import os
-import json
+import sys
+import orjson
 import pandas as pd
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # ==========================================
@@ -18,6 +21,9 @@ MAX_LAT = 58.0
 
 LONGITUDE_CUTOFF = 11.0
 
+# 1 MiB read buffer for the yearly JSONL files (default is 8 KiB)
+READ_BUFFER_SIZE = 1024 * 1024
+
 # We use sets for O(1) fast lookups
 DK1_STATION_IDS = {
     "06030", "06041", "06049", "06051", "06052", "06056", "06058", "06060", 
@@ -35,20 +41,40 @@ DK2_STATION_IDS = {
 #    , "06190", "06193", "06197"
 }
 
+# Single hashed lookup station_id -> zone for the per-record hot path
+ZONE_BY_STATION = {sid: "DK1" for sid in DK1_STATION_IDS} | {sid: "DK2" for sid in DK2_STATION_IDS}
+
+# Hour bucket per raw 'from' string. Every station and parameter shares the
+# same timestamp, so only a few thousand distinct values exist per year.
+_hour_cache = {}
+
 # ==========================================
 # PROCESSING FUNCTIONS
 # ==========================================
 
+def get_hourly_timestamp(raw_time):
+    """Floors a DMI timestamp to its UTC hour as 'YYYY-MM-DDTHH:00:00+00:00'."""
+    hour_key = _hour_cache.get(raw_time)
+    if hour_key is None:
+        if raw_time.endswith('+00:00') or raw_time.endswith('Z'):
+            # Already UTC: flooring to the hour is a pure string slice
+            hour_key = raw_time[:13] + ':00:00+00:00'
+        else:
+            ts = pd.Timestamp(raw_time)
+            ts = ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+            hour_key = ts.floor('h').strftime('%Y-%m-%dT%H:%M:%S+00:00')
+        _hour_cache[raw_time] = hour_key
+    return hour_key
+
 def get_zone(station_id, coordinates):
     """
     Determines if a record belongs to DK1 or DK2.
     1. Check explicit Station ID list.
     2. Fallback to geographically shielded bounding box.
     """
-    if station_id in DK1_STATION_IDS:
-        return "DK1"
-    if station_id in DK2_STATION_IDS:
-        return "DK2"
+    zone = ZONE_BY_STATION.get(station_id)
+    if zone:
+        return zone
     
     # Fallback: Use Coordinates [lon, lat]
     if coordinates and len(coordinates) >= 2:
@@ -71,18 +97,33 @@ def process_dmi_year(file_path):
     year = file_path.stem
     print(f"\nProcessing Year: {year}...")
     
-    records_dk1 = []
-    records_dk2 = []
+    # Running [sum, count] and reporting stations per (zone, hour, parameter).
+    # Aggregating while streaming avoids holding one dict per raw observation.
+    value_sums = defaultdict(lambda: [0.0, 0])
+    station_sets = defaultdict(set)
     unknown_stations = set()
     fallback_stations = set()
     skipped_resolutions = 0
 
-    with open(file_path, 'r', encoding='utf-8') as f:
+    # Bind hot-loop globals/attributes to locals once (LOAD_FAST instead of LOAD_GLOBAL)
+    loads = orjson.loads
+    intern = sys.intern
+    hourly_timestamp = get_hourly_timestamp
+    zone_of = get_zone
+    known_stations = ZONE_BY_STATION
+
+    # Binary mode: orjson parses the raw bytes directly (no per-line decode step)
+    with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
         for line in f:
             if not line.strip():
                 continue
+            # Cheap byte scan: day/month/year records never contain the "hour" token,
+            # so they are rejected before any JSON is materialized
+            if b'"hour"' not in line:
+                skipped_resolutions += 1
+                continue
             try:
-                obj = json.loads(line)
+                obj = loads(line)
                 props = obj.get('properties', {})
                 
                 if props.get('timeResolution') != 'hour':
@@ -94,29 +135,31 @@ def process_dmi_year(file_path):
                 raw_time = props.get('from')
                 value = props.get('value')
                 
-                if value is None or not raw_time or not station_id:
+                if value is None or not raw_time or not station_id or not param_id:
                     continue
                     
                 coordinates = obj.get('geometry', {}).get('coordinates', [])
-                zone = get_zone(station_id, coordinates)
-                
-                record = {
-                    'RawTime': raw_time,
-                    'Parameter': param_id,
-                    'Value': float(value),
-                    'StationId': station_id
-                }
+                zone = zone_of(station_id, coordinates)
                 
-                if zone == "DK1":
-                    records_dk1.append(record)
-                    if station_id not in DK1_STATION_IDS: fallback_stations.add(station_id)
-                elif zone == "DK2":
-                    records_dk2.append(record)
-                    if station_id not in DK2_STATION_IDS: fallback_stations.add(station_id)
-                else:
+                if zone == "UNKNOWN":
                     unknown_stations.add(station_id)
+                    continue
+
+                value = float(value)
+                # Every record carries fresh string objects; interning lets the keys and
+                # station sets share one object per ID (identity-fast equality, cached hash)
+                station_id = intern(station_id)
+                param_id = intern(param_id)
+                key = (zone, hourly_timestamp(raw_time), param_id)
+                entry = value_sums[key]
+                entry[0] += value
+                entry[1] += 1
+                station_sets[key].add(station_id)
+
+                if station_id not in known_stations:
+                    fallback_stations.add(station_id)
                     
-            except (json.JSONDecodeError, ValueError):
+            except (orjson.JSONDecodeError, ValueError, TypeError):
                 continue
 
     if fallback_stations:
@@ -124,30 +167,41 @@ def process_dmi_year(file_path):
     if unknown_stations:
         print(f"  [WARN] Ignored {len(unknown_stations)} stations (Greenland, Faroe, Bornholm, or unknown).")
 
-    for zone_name, records in [("DK1", records_dk1), ("DK2", records_dk2)]:
-        if not records: continue
-        df = pd.DataFrame(records)
-        df['HourUTC'] = pd.to_datetime(df['RawTime'], utc=True).dt.floor('h')
-        
-        grouped = df.groupby(['HourUTC', 'Parameter']).agg(
-            Value_Avg=('Value', 'mean'), Station_Count=('StationId', 'nunique')
-        ).reset_index()
-        
-        pivot_vals = grouped.pivot(index='HourUTC', columns='Parameter', values='Value_Avg')
-        qc_counts = grouped.groupby('HourUTC')['Station_Count'].agg(
-            Stations_Reporting_Min='min', Stations_Reporting_Max='max'
-        )
-        
-        final_df = pivot_vals.join(qc_counts).sort_index(ascending=True)
-        final_df.index = final_df.index.strftime('%Y-%m-%dT%H:%M:%S+00:00')
+    if not value_sums:
+        return
+
+    # Move the accumulators into one frame so averaging and reshaping run vectorized
+    grouped = pd.DataFrame(
+        list(value_sums.values()), columns=['Value_Sum', 'Value_Count'],
+        index=pd.MultiIndex.from_tuples(list(value_sums), names=['Zone', 'HourUTC', 'Parameter'])
+    )
+    grouped['Value_Avg'] = grouped['Value_Sum'] / grouped['Value_Count']
+    grouped['Station_Count'] = [len(station_sets[key]) for key in value_sums]
+
+    for zone_name, zone_df in grouped.groupby(level='Zone'):
+        wide = zone_df.droplevel('Zone')[['Value_Avg', 'Station_Count']].unstack('Parameter')
+        station_counts = wide['Station_Count']
+
+        # Narrow dtypes: weather readings carry ~3 significant digits and a zone has
+        # < 100 stations, so float32/int16 halve the footprint for every later step
+        final_df = wide['Value_Avg'].astype('float32')
+        final_df['Stations_Reporting_Min'] = station_counts.min(axis=1).astype('int16')
+        final_df['Stations_Reporting_Max'] = station_counts.max(axis=1).astype('int16')
+
+        # HourUTC is already a fixed-width ISO string, so lexical order is chronological
+        final_df = final_df.sort_index(ascending=True)
         final_df.index.name = 'HourUTC'
         
-        output_filename = DMI_OUTPUT_DIR / f"{year}_{zone_name}_hourly.csv"
-        final_df.to_csv(output_filename)
+        # Columnar intermediate: typed, compressed, and step 4 skips re-parsing text floats
+        output_filename = DMI_OUTPUT_DIR / f"{year}_{zone_name}_hourly.parquet"
+        final_df.reset_index().to_parquet(output_filename, index=False, compression='zstd')
         print(f"     Saved {zone_name}: {output_filename.name} ({len(final_df)} hours)")
 
 if __name__ == "__main__":
     print("Starting Geographically Shielded DMI Parser...")
     DMI_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    for file_path in sorted(DMI_RAW_DIR.glob("*.txt")):
-        process_dmi_year(file_path)
\ No newline at end of file
+    year_files = sorted(DMI_RAW_DIR.glob("*.txt"))
+    # Each year is independent and CPU-bound (JSON parsing), so fan out across cores
+    if year_files:
+        with ProcessPoolExecutor(max_workers=min(len(year_files), os.cpu_count() or 1)) as executor:
+            list(executor.map(process_dmi_year, year_files))
\ No newline at end of file
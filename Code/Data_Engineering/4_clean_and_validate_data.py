@@ -1,6 +1,11 @@
 import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from concurrent.futures import ProcessPoolExecutor
+from numba import njit, prange, set_num_threads
 from pathlib import Path
+from data_utils import READERS, read_csv_arrow, downcast_numeric
 
 # ==========================================
 # CONFIGURATION
@@ -17,33 +22,131 @@ DMI_DIR = BASE_PATH / "DMI" / "ProcessedZones"
 MISSING_THRESHOLD = 0.90 
 DOMINANCE_THRESHOLD = 0.95
 
-ALWAYS_KEEP = [
+# Set, so the per-column protection check is a hashed lookup
+ALWAYS_KEEP = {
     'HourUTC', 
     'PriceArea',
     'SpotPriceEUR',
     'DayAheadPriceEUR'
-]
+}
 
 REPORT_FILE = "data_validation_report.txt"
+# Machine-readable companion to the text report: one row per screened column
+SUMMARY_FILE = "data_validation_summary.parquet"
 
 # ==========================================
 # PROCESSING FUNCTION
 # ==========================================
-def validate_and_clean_file(file_path, report_lines):
+@njit(parallel=True, cache=True)
+def _missing_and_majority(values):
+    """
+    One fused scan per column (columns run in parallel) of a 2-D float64 array.
+    Returns the NaN count, the Boyer-Moore majority candidate among non-NaN
+    values, and that candidate's exact count. Only a value held by more than
+    half the non-NaN rows can be the candidate, which covers DOMINANCE_THRESHOLD.
+    """
+    n_rows, n_cols = values.shape
+    nan_counts = np.zeros(n_cols, np.int64)
+    candidates = np.full(n_cols, np.nan)
+    candidate_counts = np.zeros(n_cols, np.int64)
+
+    for j in prange(n_cols):
+        nans = 0
+        votes = 0
+        candidate = np.nan
+        for i in range(n_rows):
+            v = values[i, j]
+            if np.isnan(v):
+                nans += 1
+            elif votes == 0:
+                candidate = v
+                votes = 1
+            elif v == candidate:
+                votes += 1
+            else:
+                votes -= 1
+
+        count = 0
+        if not np.isnan(candidate):
+            for i in range(n_rows):
+                if values[i, j] == candidate:
+                    count += 1
+
+        nan_counts[j] = nans
+        candidates[j] = candidate
+        candidate_counts[j] = count
+
+    return nan_counts, candidates, candidate_counts
+
+def profile_columns(df):
+    """
+    Missing count per column, plus the most common value and the share of
+    non-null rows it takes. Numeric columns go through the fused Numba kernel;
+    the ratio is exact whenever it exceeds 0.5. Other columns use value_counts.
+    """
+    missing_counts = pd.Series(0, index=df.columns, dtype='int64')
+    ratios = pd.Series(0.0, index=df.columns)
+    top_values = {}
+    num_cols = df.select_dtypes(include=['number']).columns
+
+    if len(num_cols) > 0:
+        # Keep float32 blocks at float32; integers need a float view for the NaN test
+        values = df[num_cols].to_numpy()
+        if values.dtype.kind != 'f':
+            values = values.astype(np.float64)
+        values = np.asfortranarray(values)
+        nan_counts, candidates, candidate_counts = _missing_and_majority(values)
+        valid_counts = np.maximum(len(df) - nan_counts, 1)
+        missing_counts[num_cols] = nan_counts
+        ratios[num_cols] = candidate_counts / valid_counts
+        for col, candidate in zip(num_cols, candidates):
+            # Report the value in the column's own dtype (e.g. 5, not 5.0)
+            top_values[col] = df[col].dtype.type(candidate)
+
+    for col in df.columns.difference(num_cols, sort=False):
+        missing_counts[col] = df[col].isna().sum()
+        if missing_counts[col] < len(df):
+            value_counts = df[col].value_counts(normalize=True)
+            ratios[col] = value_counts.iloc[0]
+            top_values[col] = value_counts.index[0]
+    return missing_counts, ratios, top_values
+
+def init_worker(threads):
+    """
+    Pool initializer: caps Numba's and Arrow's thread pools per worker so the
+    workers split the cores instead of each starting one thread per core.
+    """
+    set_num_threads(threads)
+    pa.set_cpu_count(threads)
+
+def validate_and_clean_file(file_path):
+    """
+    Validates and cleans one file. Returns its report lines and per-column screening
+    stats instead of writing them, so files can run in parallel.
+    """
+    report_lines = []
+    column_stats = []
     if not file_path.exists():
-        return
+        return report_lines, column_stats
         
     report_lines.append(f"\nAnalyzing: {file_path.name}")
     
     try:
-        df = pd.read_csv(file_path)
+        df = READERS.get(file_path.suffix, read_csv_arrow)(file_path)
     except Exception as e:
         report_lines.append(f"  [ERROR] Reading file: {e}")
-        return
+        return report_lines, column_stats
+
+    mem_before = df.memory_usage(deep=False).sum()
+    df = downcast_numeric(df)
+    mem_after = df.memory_usage(deep=False).sum()
+    report_lines.append(f"  Downcast numerics: {mem_before / 1e6:.1f} MB -> {mem_after / 1e6:.1f} MB")
 
     # --- NEW: STEP 0: Filter PriceArea ---
     if 'PriceArea' in df.columns:
         initial_rows = len(df)
+        # Few distinct areas: category makes the filter an integer-code lookup
+        df['PriceArea'] = df['PriceArea'].astype('category')
         df = df[df['PriceArea'].isin(['DK1', 'DK2'])]
         filtered_rows = len(df)
         report_lines.append(f"  Filtered PriceArea: Kept {filtered_rows} DK1/DK2 rows (Dropped {initial_rows - filtered_rows} foreign rows).")
@@ -51,32 +154,43 @@ def validate_and_clean_file(file_path, report_lines):
     rows = len(df)
     if rows == 0:
         report_lines.append("  [ERROR] File is empty or no DK1/DK2 rows remain. Skipping file.")
-        return
+        return report_lines, column_stats
 
     cols_to_drop = []
     reasons = {}
 
+    # Exchange columns are classified once; they are never dropped, so this stays valid below
+    exchange_cols = [col for col in df.columns if 'exchange' in col.lower()]
+    protected = ALWAYS_KEEP.union(exchange_cols)
+
     # --- STEP 1: Identify Bad Columns ---
-    for col in df.columns:
-        # Protect explicitly kept columns AND any column containing "exchange"
-        if col in ALWAYS_KEEP or 'exchange' in col.lower():
-            continue
-            
-        missing_ratio = df[col].isna().sum() / rows
+    # Protect explicitly kept columns AND any column containing "exchange"
+    candidates = [col for col in df.columns if col not in protected]
+    missing_counts, top_ratios, top_values = profile_columns(df[candidates])
+    missing_ratios = missing_counts / rows
+
+    for col in candidates:
+        missing_ratio = missing_ratios[col]
+        most_common_ratio = top_ratios[col]
+        column_stats.append({
+            'File': file_path.name,
+            'Column': col,
+            'Missing_Ratio': missing_ratio,
+            # The kernel's ratio is only exact for a strict majority; below that it is unknown
+            'Majority_Ratio': most_common_ratio if most_common_ratio > 0.5 else np.nan,
+            'Decision': 'kept',
+        })
+
         if missing_ratio > MISSING_THRESHOLD:
             cols_to_drop.append(col)
             reasons[col] = f"Missing {missing_ratio:.1%} of data."
+            column_stats[-1]['Decision'] = 'dropped_missing'
             continue
-            
-        valid_data = df[col].dropna()
-        if len(valid_data) > 0:
-            value_counts = valid_data.value_counts(normalize=True)
-            most_common_ratio = value_counts.iloc[0]
-            top_value = value_counts.index[0]
-            
-            if most_common_ratio > DOMINANCE_THRESHOLD:
-                cols_to_drop.append(col)
-                reasons[col] = f"Constant value '{top_value}' in {most_common_ratio:.1%} of rows."
+
+        if most_common_ratio > DOMINANCE_THRESHOLD:
+            cols_to_drop.append(col)
+            reasons[col] = f"Constant value '{top_values[col]}' in {most_common_ratio:.1%} of rows."
+            column_stats[-1]['Decision'] = 'dropped_constant'
 
     # --- STEP 2: Drop Bad Columns ---
     if cols_to_drop:
@@ -88,7 +202,6 @@ def validate_and_clean_file(file_path, report_lines):
         report_lines.append("  No columns required dropping.")
 
     # --- NEW: STEP 3A: Zero-Fill Exchange Columns ---
-    exchange_cols = [col for col in df.columns if 'exchange' in col.lower()]
     if exchange_cols:
         missing_exchange = df[exchange_cols].isna().sum().sum()
         if missing_exchange > 0:
@@ -98,21 +211,23 @@ def validate_and_clean_file(file_path, report_lines):
     # --- STEP 3B: Time-Aware Interpolation & Flagging (For non-exchange numeric columns) ---
     all_numeric_cols = df.select_dtypes(include=['number']).columns
     # Isolate columns that need strict mathematical interpolation
-    numeric_cols = [col for col in all_numeric_cols if 'exchange' not in col.lower()]
+    exchange_set = set(exchange_cols)
+    numeric_cols = [col for col in all_numeric_cols if col not in exchange_set]
     
-    missing_before = df[numeric_cols].isna().sum().sum() if numeric_cols else 0
+    # One NaN mask feeds the missing total, the per-column check and the flags
+    missing_mask = df[numeric_cols].isna()
+    missing_per_col = missing_mask.sum()
+    missing_before = missing_per_col.sum() if numeric_cols else 0
     
     if missing_before > 0:
-        # A. Create Imputation Flags (Shadow Variables)
-        flagged_count = 0
-        for col in numeric_cols:
-            if df[col].isna().sum() > 0:
-                df[f"{col}_imputed"] = df[col].isna().astype(int)
-                flagged_count += 1
+        # A. Create Imputation Flags (Shadow Variables), all columns in one assignment
+        flags = missing_mask.loc[:, missing_per_col > 0].astype(int).add_suffix('_imputed')
+        df[flags.columns] = flags
+        flagged_count = len(flags.columns)
                 
         # B. Convert to Datetime and set as Index
         if 'HourUTC' in df.columns:
-            df['HourUTC'] = pd.to_datetime(df['HourUTC'], utc=True)
+            df['HourUTC'] = pd.to_datetime(df['HourUTC'], utc=True, format='ISO8601')
             df.set_index('HourUTC', inplace=True)
             time_indexed = True
         else:
@@ -127,11 +242,8 @@ def validate_and_clean_file(file_path, report_lines):
         # D. 2nd Pass: Forward/Backward fill for edge cases (Capped at 12 hours)
         df[numeric_cols] = df[numeric_cols].ffill(limit=12).bfill(limit=12)
         
-        # E. 3rd Pass: Column Mean Failsafe
-        for col in numeric_cols:
-            if df[col].isna().sum() > 0:
-                col_mean = df[col].mean()
-                df[col] = df[col].fillna(col_mean)
+        # E. 3rd Pass: Column Mean Failsafe (one frame-wide fill; complete columns are untouched)
+        df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].mean())
 
         # F. Reset index and restore strict string formatting
         if time_indexed:
@@ -146,9 +258,11 @@ def validate_and_clean_file(file_path, report_lines):
     output_name = output_name.replace("_standardized_validated", "_validated")
     output_path = file_path.parent / output_name
     
+    # pandas keeps the '.0' on integral floats, so later steps read these columns back as float
     df.to_csv(output_path, index=False)
     report_lines.append(f"  Saved validated data to: {output_name}")
     report_lines.append("-" * 40)
+    return report_lines, column_stats
 
 # ==========================================
 # MAIN EXECUTION
@@ -160,18 +274,29 @@ def main():
     report_lines.append("          DATA VALIDATION & CLEANING REPORT")
     report_lines.append("==================================================")
     
-    for file_path in TARGET_FILES:
-        validate_and_clean_file(file_path, report_lines)
-        
+    files = list(TARGET_FILES)
     if DMI_DIR.exists():
-        dmi_files = sorted(DMI_DIR.glob("*_hourly.csv"))
-        for dmi_file in dmi_files:
-            validate_and_clean_file(dmi_file, report_lines)
-    else:
+        files += sorted(DMI_DIR.glob("*_hourly.parquet"))
+
+    # Every file is cleaned independently, so fan out across cores;
+    # map() yields results in input order, keeping the report layout stable
+    summary_rows = []
+    cpu_count = os.cpu_count() or 1
+    workers = min(len(files), cpu_count)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(max(1, cpu_count // workers),)) as executor:
+        for file_lines, file_stats in executor.map(validate_and_clean_file, files):
+            report_lines.extend(file_lines)
+            summary_rows.extend(file_stats)
+
+    if not DMI_DIR.exists():
         report_lines.append(f"\n[WARN] DMI directory not found: {DMI_DIR}")
 
     with open(REPORT_FILE, "w", encoding="utf-8") as f:
         f.write("\n".join(report_lines))
+
+    if summary_rows:
+        pd.DataFrame(summary_rows).to_parquet(SUMMARY_FILE, index=False, compression='zstd')
         
     print(f"Validation complete! Please check '{REPORT_FILE}' for details.")
 
@@ -19,6 +19,13 @@ DMI_ALIGNED_DIR = BASE_PATH / "DMI" / "AlignedZones"
 OUTPUT_DIR = BASE_PATH / "Aligned_Yearly"
 REPORT_FILE = "alignment_and_split_report.txt"
 
+ISO_UTC_FORMAT = '%Y-%m-%dT%H:%M:%S+00:00'
+
+# Known column types, so read_csv skips inference for them. PriceArea has a
+# handful of distinct values, so category turns its compares/groupbys into int codes.
+# Any groupby on it must pass observed=True to skip empty category combinations.
+CSV_DTYPES = {'PriceArea': 'category'}
+
 def enforce_dmi_consistency(report_lines):
     print("Step 1: Enforcing DMI Column Consistency (Non-Destructive)...")
     report_lines.append("--- STEP 1: DMI COLUMN CONSISTENCY ---")
@@ -75,16 +82,21 @@ def enforce_dmi_consistency(report_lines):
         
     return aligned_files
 
+def read_hourly_csv(path, **kwargs):
+    """
+    Reads a CSV with HourUTC parsed in the C reader. Uniform '+00:00' files come out
+    tz-aware already; any other offset leaves object dtype, so normalise to UTC after.
+    """
+    df = pd.read_csv(path, parse_dates=['HourUTC'], date_format='ISO8601', **kwargs)
+    df['HourUTC'] = pd.to_datetime(df['HourUTC'], utc=True, format='ISO8601')
+    return df
+
 def combine_prices(report_lines):
     print("\nStep 2: Combining, Aggregating, and Sorting Price Files...")
     report_lines.append("\n--- STEP 2: PRICE COMBINATION & AGGREGATION ---")
     
-    df_spot = pd.read_csv(SPOT_PRICE_FILE)
-    df_da = pd.read_csv(DAY_AHEAD_FILE)
-    
-    # Safely convert to datetime objects
-    df_spot['HourUTC'] = pd.to_datetime(df_spot['HourUTC'], utc=True)
-    df_da['HourUTC'] = pd.to_datetime(df_da['HourUTC'], utc=True)
+    df_spot = read_hourly_csv(SPOT_PRICE_FILE, dtype=CSV_DTYPES)
+    df_da = read_hourly_csv(DAY_AHEAD_FILE, dtype=CSV_DTYPES)
     
     # --- THE 15-MINUTE RESOLUTION FIX ---
     # 1. Force all timestamps to round down to the nearest hour
@@ -93,32 +105,40 @@ def combine_prices(report_lines):
     
     # 2. Group by the new hourly timestamp and average the prices
     # ADDED numeric_only=True to prevent crashes on leftover string columns
-    df_spot = df_spot.groupby(['HourUTC', 'PriceArea'], as_index=False).mean(numeric_only=True)
-    df_da = df_da.groupby(['HourUTC', 'PriceArea'], as_index=False).mean(numeric_only=True)
+    # Keys are (PriceArea, HourUTC) so each side comes out of groupby already in final order
+    df_spot = df_spot.groupby(['PriceArea', 'HourUTC'], as_index=False, observed=True).mean(numeric_only=True)
+    df_da = df_da.groupby(['PriceArea', 'HourUTC'], as_index=False, observed=True).mean(numeric_only=True)
     
-    # Merge on Time and Area
-    df_combined = pd.merge(df_spot, df_da, on=['HourUTC', 'PriceArea'], how='outer')
+    # Merge on Area and Time (an outer merge emits keys sorted, so no separate sort pass)
+    df_combined = pd.merge(df_spot, df_da, on=['PriceArea', 'HourUTC'], how='outer')
     
     # Reorder columns to be logical and consistent
     price_cols = ['HourUTC', 'PriceArea', 'SpotPriceEUR', 'DayAheadPriceEUR']
     extra_cols = sorted([c for c in df_combined.columns if c not in price_cols])
     df_combined = df_combined[price_cols + extra_cols]
     
-    df_combined = df_combined.sort_values(by=['PriceArea', 'HourUTC'], ascending=True)
-    
     msg = f"  -> Aggregated and combined prices into master frame with {len(df_combined)} rows."
     print(msg)
     report_lines.append(msg)
     
     return df_combined
 
+def slice_hours(df, start_date, end_date):
+    """Rows of an HourUTC-sorted frame with start_date <= HourUTC <= end_date (binary search, no mask scan)."""
+    lo = df['HourUTC'].searchsorted(start_date, side='left')
+    hi = df['HourUTC'].searchsorted(end_date, side='right')
+    return df.iloc[lo:hi]
+
 def split_datasets(aligned_dmi_files, df_prices, report_lines):
     print("\nStep 3: Splitting Prices and Prod/Cons by Year and Region...")
     report_lines.append("\n--- STEP 3: YEARLY & REGIONAL SPLITS ---")
     
-    df_prod = pd.read_csv(PROD_CONS_FILE)
-    df_prod['HourUTC'] = pd.to_datetime(df_prod['HourUTC'], utc=True)
+    df_prod = read_hourly_csv(PROD_CONS_FILE, dtype=CSV_DTYPES)
     df_prod = df_prod.sort_values(by=['PriceArea', 'HourUTC'], ascending=True)
+
+    # Partition each source by region once; every partition is HourUTC-sorted
+    prices_by_area = dict(tuple(df_prices.groupby('PriceArea', sort=False, observed=True)))
+    prod_by_area = dict(tuple(df_prod.groupby('PriceArea', sort=False, observed=True)))
     
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
@@ -135,26 +155,18 @@ def split_datasets(aligned_dmi_files, df_prices, report_lines):
         region = match.group(2)
         
         # Read DMI file and convert to datetime for safe temporal math
-        df_dmi = pd.read_csv(dmi_file)
-        df_dmi['HourUTC'] = pd.to_datetime(df_dmi['HourUTC'], utc=True)
+        df_dmi = read_hourly_csv(dmi_file, usecols=['HourUTC'])
         
         start_date = df_dmi['HourUTC'].min()
         end_date = df_dmi['HourUTC'].max()
         
-        # Safe Datetime Filtering
-        mask_prices = (df_prices['PriceArea'] == region) & (df_prices['HourUTC'] >= start_date) & (df_prices['HourUTC'] <= end_date)
-        prices_subset = df_prices[mask_prices].copy()
-        
-        mask_prod = (df_prod['PriceArea'] == region) & (df_prod['HourUTC'] >= start_date) & (df_prod['HourUTC'] <= end_date)
-        prod_subset = df_prod[mask_prod].copy()
-        
-        # Restore strict ISO-8601 string formatting before saving
-        prices_subset['HourUTC'] = prices_subset['HourUTC'].dt.strftime('%Y-%m-%dT%H:%M:%S+00:00')
-        prod_subset['HourUTC'] = prod_subset['HourUTC'].dt.strftime('%Y-%m-%dT%H:%M:%S+00:00')
+        # Safe Datetime Filtering (region partitions are sorted, so the window is a contiguous slice)
+        prices_subset = slice_hours(prices_by_area.get(region, df_prices.iloc[0:0]), start_date, end_date)
+        prod_subset = slice_hours(prod_by_area.get(region, df_prod.iloc[0:0]), start_date, end_date)
         
-        # Save Outputs
-        prices_subset.to_csv(OUTPUT_DIR / f"Prices_{year}_{region}.csv", index=False)
-        prod_subset.to_csv(OUTPUT_DIR / f"ProdCons_{year}_{region}.csv", index=False)
+        # Save Outputs, restoring strict ISO-8601 string formatting at write time
+        prices_subset.to_csv(OUTPUT_DIR / f"Prices_{year}_{region}.csv", index=False, date_format=ISO_UTC_FORMAT)
+        prod_subset.to_csv(OUTPUT_DIR / f"ProdCons_{year}_{region}.csv", index=False, date_format=ISO_UTC_FORMAT)
         
         msg = f"  -> {year} {region}: Generated Prices ({len(prices_subset)} rows), ProdCons ({len(prod_subset)} rows)"
         print(msg)
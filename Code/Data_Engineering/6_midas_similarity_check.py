@@ -1,6 +1,5 @@
 import pandas as pd
 import os
-import json
 
 # ==========================================
 # CONFIGURATION
@@ -32,11 +31,10 @@ def load_data():
         return None, None
         
     df_csv = pd.read_csv(CSV_PATH)
-    df_csv['HourUTC'] = pd.to_datetime(df_csv['HourUTC'], utc=True)
+    df_csv['HourUTC'] = pd.to_datetime(df_csv['HourUTC'], utc=True, format='ISO8601')
     
-    with open(JSON_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    df_midas = pd.DataFrame(data)
+    # Same read as build_midas_matrix.load_midas_dataframe
+    df_midas = pd.read_json(JSON_PATH, convert_dates=False, dtype=False, precise_float=True)
     
     if 'datetime' in df_midas.columns:
         df_midas['HourUTC'] = pd.to_datetime(df_midas['datetime'], utc=True)
@@ -74,7 +72,8 @@ def run_diagnostics():
         corr = c_csv.corr(c_midas)
         mae = (c_csv - c_midas).abs().mean()
         
-        scale = c_csv.mean() / c_midas.mean() if c_midas.mean() != 0 else 0
+        midas_mean = c_midas.mean()
+        scale = c_csv.mean() / midas_mean if midas_mean != 0 else 0
         
         print(f"{col_csv:<20} | {col_midas:<22} | {corr:>6.3f} | {mae:>8.2f} | {scale:.2f}x")
 
@@ -86,26 +85,27 @@ def run_diagnostics():
 
     # Get all numeric columns from CSV to test against
     csv_numeric_cols = df_csv.select_dtypes(include=['number']).columns
+    candidates = [c for c in csv_numeric_cols if c in df_merged.columns]
+    targets = [t for t in MIDAS_TARGETS if t in df_merged.columns]
+    if not candidates or not targets:
+        return
+
+    # One pairwise-complete correlation matrix and one mean pass instead of a corr() per pair
+    matrix_cols = list(dict.fromkeys(candidates + targets))
+    abs_corr = df_merged[matrix_cols].corr().loc[candidates, targets].abs()
+    means = df_merged[matrix_cols].mean()
 
-    for target in MIDAS_TARGETS:
-        if target not in df_merged.columns:
+    for target in targets:
+        target_corr = abs_corr[target].dropna()
+        if target_corr.empty:
             continue
-            
-        best_col = None
-        best_corr = -1
-        mean_diff = 0
-        
-        for candidate in csv_numeric_cols:
-            if candidate not in df_merged.columns: continue
-            
-            corr = df_merged[target].corr(df_merged[candidate])
-            if pd.notna(corr) and abs(corr) > best_corr:
-                best_corr = abs(corr)
-                best_col = candidate
-                mean_diff = df_merged[candidate].mean() - df_merged[target].mean()
-
-        if best_col:
-            print(f"{target:<22} | {best_col:<25} | {best_corr:>6.3f} | {mean_diff:>8.2f}")
+
+        # idxmax keeps the first column on ties, like the old strict '>' scan
+        best_col = target_corr.idxmax()
+        best_corr = target_corr[best_col]
+        mean_diff = means[best_col] - means[target]
+
+        print(f"{target:<22} | {best_col:<25} | {best_corr:>6.3f} | {mean_diff:>8.2f}")
 
 if __name__ == "__main__":
     run_diagnostics()
\ No newline at end of file
@@ -37,9 +37,9 @@ def enforce_common_boundaries():
         df_prod = pd.read_csv(prod_file)
 
         # Convert to Datetime for accurate comparison
-        df_dmi['HourUTC_dt'] = pd.to_datetime(df_dmi['HourUTC'])
-        df_price['HourUTC_dt'] = pd.to_datetime(df_price['HourUTC'])
-        df_prod['HourUTC_dt'] = pd.to_datetime(df_prod['HourUTC'])
+        df_dmi['HourUTC_dt'] = pd.to_datetime(df_dmi['HourUTC'], format='ISO8601')
+        df_price['HourUTC_dt'] = pd.to_datetime(df_price['HourUTC'], format='ISO8601')
+        df_prod['HourUTC_dt'] = pd.to_datetime(df_prod['HourUTC'], format='ISO8601')
 
         # Find absolute limits
         start_dmi, end_dmi = df_dmi['HourUTC_dt'].min(), df_dmi['HourUTC_dt'].max()
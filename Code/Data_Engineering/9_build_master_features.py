@@ -97,7 +97,7 @@ def build_region_master(region):
 
     # 2. Stack the 10 years into one massive timeline
     master_df = pd.concat(all_merged_years, ignore_index=True)
-    master_df['HourUTC_dt'] = pd.to_datetime(master_df['HourUTC'], utc=True)
+    master_df['HourUTC_dt'] = pd.to_datetime(master_df['HourUTC'], utc=True, format='ISO8601')
     master_df = master_df.sort_values('HourUTC_dt').reset_index(drop=True)
     
     print(f"  -> Merged {len(years)} years: {len(master_df)} total hours.")
@@ -143,7 +143,9 @@ def build_region_master(region):
     
     # A. Only drop rows where the absolute edges were created by our specific shifts
     edge_columns = [target_name] + [f'SpotPriceEUR_lag_{lag}h' for lag in PRICE_LAGS]
-    master_df = master_df.dropna(subset=edge_columns)
+    # One isnan reduction over the edge block instead of pandas' per-column dropna dispatch
+    edge_nan = np.isnan(master_df[edge_columns].to_numpy(dtype=np.float64)).any(axis=1)
+    master_df = master_df.iloc[~edge_nan]
     
     # B. Fill any remaining historical NaNs (e.g., market types or solar farms that didn't exist in 2015) with 0
     master_df = master_df.fillna(0)
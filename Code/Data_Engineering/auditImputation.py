@@ -19,6 +19,7 @@ Run from the project root directory (same level as the Data folder).
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from data_utils import READERS, read_csv_arrow, downcast_numeric
 
 # =====================================================================
 # CONFIGURATION
@@ -33,7 +34,7 @@ DMI_ALIGNED_DIR   = BASE_PATH / "DMI" / "AlignedZones"
 ALIGNED_DIR       = BASE_PATH / "Aligned_Yearly"
 ML_READY_DIR      = BASE_PATH / "ML_Ready_Data"
 
-ALWAYS_KEEP = ['HourUTC', 'PriceArea', 'SpotPriceEUR', 'DayAheadPriceEUR']
+ALWAYS_KEEP = {'HourUTC', 'PriceArea', 'SpotPriceEUR', 'DayAheadPriceEUR'}
 REGIONS     = ["DK1", "DK2"]
 
 
@@ -62,7 +63,9 @@ def header(title):
 def load_df(path, filter_dk=False):
     if not path or not Path(path).exists():
         return None
-    df = pd.read_csv(path)
+    df = READERS.get(Path(path).suffix, read_csv_arrow)(path)
+    # Same narrowing as step 4, so dominance is screened on identical values
+    df = downcast_numeric(df)
     if filter_dk and 'PriceArea' in df.columns:
         df = df[df['PriceArea'].isin(['DK1', 'DK2'])].copy()
     return df
@@ -81,7 +84,7 @@ def simulate_imputation(df):
 
     work = df[numeric_cols].copy()
     if 'HourUTC' in df.columns:
-        work.index = pd.to_datetime(df['HourUTC'], utc=True)
+        work.index = pd.to_datetime(df['HourUTC'], utc=True, format='ISO8601')
         work = work.sort_index()
 
     original_missing = work.isna()
@@ -102,26 +105,46 @@ def simulate_imputation(df):
     still_p2  = p2.isna()
     filled_p2 = int((still_p1 & ~still_p2).sum().sum())
 
-    mean_cols = {col: int(still_p2[col].sum())
-                 for col in numeric_cols if still_p2[col].sum() > 0}
+    still_counts = still_p2.sum()
+    mean_cols = {col: int(n) for col, n in still_counts.items() if n > 0}
     filled_p3 = sum(mean_cols.values())
 
     return total_values, total_missing, filled_p1, filled_p2, filled_p3, mean_cols
 
+def dominant_ratios(df):
+    """
+    Share of non-null rows taken by each column's most common value.
+    A value held by more than half the rows is always the median, so numeric
+    columns are scored with one vectorized median + equality sweep. The ratio
+    is exact whenever it exceeds 0.5, which covers DOMINANCE_THRESHOLD.
+    """
+    valid_counts = df.notna().sum()
+    num_cols = df.select_dtypes(include=['number']).columns
+    ratios = pd.Series(0.0, index=df.columns)
+
+    if len(num_cols) > 0:
+        medians = df[num_cols].median()
+        ratios[num_cols] = df[num_cols].eq(medians).sum() / valid_counts[num_cols].clip(lower=1)
+
+    for col in df.columns.difference(num_cols, sort=False):
+        if valid_counts[col] > 0:
+            ratios[col] = df[col].value_counts(normalize=True).iloc[0]
+    return ratios
+
 def identify_dropped(df, rows):
     dropped_m, dropped_c = [], []
-    for col in df.columns:
-        if col in ALWAYS_KEEP or 'exchange' in col.lower():
-            continue
-        miss = df[col].isna().sum() / rows
+    protected = ALWAYS_KEEP.union(c for c in df.columns if 'exchange' in c.lower())
+    candidates = [col for col in df.columns if col not in protected]
+    miss_ratios = df[candidates].isna().sum() / rows
+    top_ratios = dominant_ratios(df[candidates])
+    for col in candidates:
+        miss = miss_ratios[col]
         if miss > MISSING_THRESHOLD:
             dropped_m.append((col, miss))
             continue
-        valid = df[col].dropna()
-        if len(valid) > 0:
-            top_r = valid.value_counts(normalize=True).iloc[0]
-            if top_r > DOMINANCE_THRESHOLD:
-                dropped_c.append((col, top_r))
+        top_r = top_ratios[col]
+        if top_r > DOMINANCE_THRESHOLD:
+            dropped_c.append((col, top_r))
     return dropped_m, dropped_c
 
 
@@ -237,7 +260,7 @@ def audit_prod_cons():
 def audit_weather(region):
     header(f"WEATHER DATA — {region}")
 
-    yearly_files = sorted(DMI_PROCESSED_DIR.glob(f"*_{region}_hourly.csv"))
+    yearly_files = sorted(DMI_PROCESSED_DIR.glob(f"*_{region}_hourly.parquet"))
     aligned_files = sorted(DMI_ALIGNED_DIR.glob(f"*_{region}_hourly_aligned.csv"))
     master_files  = sorted(ML_READY_DIR.glob(f"Master_Matrix_{region}_*.csv"))
 
@@ -0,0 +1,55 @@
+"""
+Shared helpers for the Data_Engineering scripts.
+Contains the Arrow-backed CSV reader and the numeric downcast shared by step 4
+and the imputation audit, so the audit screens exactly what step 4 screens.
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+# Text columns of the Energinet exports. Pinned to string so Arrow never parses the
+# timestamps; names missing from a file are ignored. All other columns are inferred.
+TEXT_COLUMNS = ('HourUTC', 'HourDK', 'TimeDK', 'PriceArea')
+
+# =====================================================================
+# CSV LOADING
+# =====================================================================
+def read_csv_arrow(file_path):
+    """
+    Reads a CSV with pyarrow's multithreaded parser in a single pass.
+    TEXT_COLUMNS keep their original strings; Arrow infers the rest as int64,
+    float64, bool or string. Empty cells are NaN in every column, and all-empty
+    columns come back as float64. Unlike the pandas C engine, integers beyond the
+    int64 range become float64 rather than uint64.
+    """
+    convert_options = pacsv.ConvertOptions(
+        column_types={col: pa.string() for col in TEXT_COLUMNS},
+        strings_can_be_null=True,
+    )
+    table = pacsv.read_csv(file_path, convert_options=convert_options)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table.to_pandas()
+
+# Loader per input kind, resolved once per file instead of an if/else chain
+READERS = {
+    '.parquet': pd.read_parquet,  # DMI zone files from step 3
+    '.csv': read_csv_arrow,       # Energinet price / production files
+}
+
+# =====================================================================
+# DTYPE NARROWING
+# =====================================================================
+def downcast_numeric(df):
+    """
+    Narrows float64 -> float32 and int64 -> the smallest integer type that fits.
+    Energy, price and weather values carry far fewer than 7 significant digits,
+    so every later scan, interpolation and write moves half the bytes.
+    """
+    for col in df.select_dtypes(include=['float64']).columns:
+        df[col] = df[col].astype('float32')
+    for col in df.select_dtypes(include=['integer']).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
@@ -28,88 +28,94 @@ def create_summary_report(input_csv="experiment_results.csv", output_txt="experi
     metrics = ['MAE', 'RMSE', 'WMAPE', 'MDA', 'R2', 'sMAPE']
     
     print("Generating report...")
-    with open(output_txt, 'w', encoding='utf-8') as f:
-        f.write("=================================================================\n")
-        f.write("                 EXPERIMENT SUMMARY REPORT\n")
-        f.write("=================================================================\n\n")
-        
-        # --- NEW DISCLAIMER BLOCK ---
-        f.write("METHODOLOGICAL NOTE ON METRICS AND DELTA TARGETS:\n")
-        f.write("When predicting 'Delta' (the hour-to-hour change in price), percentage-based\n")
-        f.write("metrics like WMAPE mathematically explode. Because the actual target values\n")
-        f.write("are clustered near zero, dividing any error by a near-zero denominator\n")
-        f.write("creates an artificially massive percentage.\n\n")
-        f.write("To ensure a true 1:1 scientific comparison between Absolute Price targets\n")
-        f.write("and Delta targets, this summary ranks all experiments using Mean Absolute\n")
-        f.write("Error (MAE). MAE represents the average error in raw Euros, stripping away\n")
-        f.write("percentage distortions and revealing the true predictive accuracy.\n")
-        f.write("-----------------------------------------------------------------\n\n")
-        
-        # --- PART 1: OVERALL BEST/WORST EXPERIMENTS (NOW USING MAE) ---
-        f.write("PART 1: BEST & WORST FEATURE SETS PER HORIZON\n")
-        f.write("(Ranked by Average MAE [Raw Euro Error] across all tested models)\n")
-        f.write("-----------------------------------------------------------------\n")
+    # Collect the report in memory; the file is only opened (and truncated) once it is complete
+    report_parts = []
+    out = report_parts.append
+
+    out("=================================================================\n")
+    out("                 EXPERIMENT SUMMARY REPORT\n")
+    out("=================================================================\n\n")
+    
+    # --- NEW DISCLAIMER BLOCK ---
+    out("METHODOLOGICAL NOTE ON METRICS AND DELTA TARGETS:\n")
+    out("When predicting 'Delta' (the hour-to-hour change in price), percentage-based\n")
+    out("metrics like WMAPE mathematically explode. Because the actual target values\n")
+    out("are clustered near zero, dividing any error by a near-zero denominator\n")
+    out("creates an artificially massive percentage.\n\n")
+    out("To ensure a true 1:1 scientific comparison between Absolute Price targets\n")
+    out("and Delta targets, this summary ranks all experiments using Mean Absolute\n")
+    out("Error (MAE). MAE represents the average error in raw Euros, stripping away\n")
+    out("percentage distortions and revealing the true predictive accuracy.\n")
+    out("-----------------------------------------------------------------\n\n")
+    
+    # --- PART 1: OVERALL BEST/WORST EXPERIMENTS (NOW USING MAE) ---
+    out("PART 1: BEST & WORST FEATURE SETS PER HORIZON\n")
+    out("(Ranked by Average MAE [Raw Euro Error] across all tested models)\n")
+    out("-----------------------------------------------------------------\n")
+    
+    for target in sorted(df['Target_Type'].unique()):
+        out(f"\n[ TARGET TYPE: {target} ]\n")
+        df_t = df[df['Target_Type'] == target]
         
-        for target in sorted(df['Target_Type'].unique()):
-            f.write(f"\n[ TARGET TYPE: {target} ]\n")
-            df_t = df[df['Target_Type'] == target]
+        for horizon in sorted(df_t['Horizon'].unique()):
+            df_h = df_t[df_t['Horizon'] == horizon]
+            
+            # Group by base experiment and calculate mean MAE
+            exp_scores = df_h.groupby('Base_Experiment')['MAE'].mean().reset_index()
+            exp_scores = exp_scores.sort_values('MAE', ascending=True)
             
-            for horizon in sorted(df_t['Horizon'].unique()):
-                df_h = df_t[df_t['Horizon'] == horizon]
+            if not exp_scores.empty:
+                best = exp_scores.iloc[0]
+                worst = exp_scores.iloc[-1]
                 
-                # Group by base experiment and calculate mean MAE
-                exp_scores = df_h.groupby('Base_Experiment')['MAE'].mean().reset_index()
-                exp_scores = exp_scores.sort_values('MAE', ascending=True)
+                out(f"  Horizon {horizon}h:\n")
+                out(f"    -> BEST OVERALL:  {best['Base_Experiment']} (Avg MAE: {best['MAE']:.2f} Euros)\n")
+                out(f"    -> WORST OVERALL: {worst['Base_Experiment']} (Avg MAE: {worst['MAE']:.2f} Euros)\n")
                 
-                if not exp_scores.empty:
-                    best = exp_scores.iloc[0]
-                    worst = exp_scores.iloc[-1]
-                    
-                    f.write(f"  Horizon {horizon}h:\n")
-                    f.write(f"    -> BEST OVERALL:  {best['Base_Experiment']} (Avg MAE: {best['MAE']:.2f} Euros)\n")
-                    f.write(f"    -> WORST OVERALL: {worst['Base_Experiment']} (Avg MAE: {worst['MAE']:.2f} Euros)\n")
-                    
-        f.write("\n\n")
-        
-        # --- PART 2: DETAILED METRICS ---
-        f.write("PART 2: METRIC BREAKDOWN BY MODEL AND HORIZON\n")
-        f.write("-----------------------------------------------------------------\n")
+    out("\n\n")
+    
+    # --- PART 2: DETAILED METRICS ---
+    out("PART 2: METRIC BREAKDOWN BY MODEL AND HORIZON\n")
+    out("-----------------------------------------------------------------\n")
+    
+    for target in sorted(df['Target_Type'].unique()):
+        df_t = df[df['Target_Type'] == target]
         
-        for target in sorted(df['Target_Type'].unique()):
-            df_t = df[df['Target_Type'] == target]
+        for horizon in sorted(df_t['Horizon'].unique()):
+            out(f"\n==================================================\n")
+            out(f" HORIZON: {horizon}h  |  TARGET: {target}\n")
+            out(f"==================================================\n")
             
-            for horizon in sorted(df_t['Horizon'].unique()):
-                f.write(f"\n==================================================\n")
-                f.write(f" HORIZON: {horizon}h  |  TARGET: {target}\n")
-                f.write(f"==================================================\n")
+            df_h = df_t[df_t['Horizon'] == horizon]
+            
+            for model in sorted(df_h['Model'].unique()):
+                df_m = df_h[df_h['Model'] == model]
                 
-                df_h = df_t[df_t['Horizon'] == horizon]
+                out(f"\n  MODEL: {model}\n")
+                out("  " + "-"*40 + "\n")
                 
-                for model in sorted(df_h['Model'].unique()):
-                    df_m = df_h[df_h['Model'] == model]
-                    
-                    f.write(f"\n  MODEL: {model}\n")
-                    f.write("  " + "-"*40 + "\n")
-                    
-                    for m in metrics:
-                        if m not in df_m.columns:
-                            continue
-                            
-                        valid = df_m.dropna(subset=[m])
-                        if valid.empty:
-                            continue
-                            
-                        avg_val = valid[m].mean()
-                        max_val = valid[m].max()
-                        min_val = valid[m].min()
+                for m in metrics:
+                    if m not in df_m.columns:
+                        continue
                         
-                        max_exp = valid.loc[valid[m].idxmax(), 'Base_Experiment']
-                        min_exp = valid.loc[valid[m].idxmin(), 'Base_Experiment']
+                    valid = df_m.dropna(subset=[m])
+                    if valid.empty:
+                        continue
                         
-                        f.write(f"    {m}:\n")
-                        f.write(f"      Average: {avg_val:.4f}\n")
-                        f.write(f"      Max:     {max_val:.4f}  (from {max_exp})\n")
-                        f.write(f"      Min:     {min_val:.4f}  (from {min_exp})\n")
+                    avg_val = valid[m].mean()
+                    max_val = valid[m].max()
+                    min_val = valid[m].min()
+                    
+                    max_exp = valid.loc[valid[m].idxmax(), 'Base_Experiment']
+                    min_exp = valid.loc[valid[m].idxmin(), 'Base_Experiment']
+                    
+                    out(f"    {m}:\n")
+                    out(f"      Average: {avg_val:.4f}\n")
+                    out(f"      Max:     {max_val:.4f}  (from {max_exp})\n")
+                    out(f"      Min:     {min_val:.4f}  (from {min_exp})\n")
+
+    with open(output_txt, 'w', encoding='utf-8') as f:
+        f.writelines(report_parts)
 
     print("Done! Summary successfully saved to " + output_txt)
 
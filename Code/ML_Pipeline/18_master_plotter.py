@@ -1,6 +1,6 @@
 import os
 import pickle
-import glob
+import fnmatch
 import pandas as pd
 import numpy as np
 import matplotlib
@@ -89,6 +89,28 @@ def load_csv(csv_file="experiment_results.csv"):
     return df
 
 
+# =====================================================================
+# SHARED HELPER: Find prediction pickles
+# =====================================================================
+_log_dir_listing = {}
+
+def find_prediction_files(log_dir, base_exp, horizon, target_type):
+    """Same matches as glob(f"{log_dir}/*{base_exp}*{horizon}h*{target_type}*.pkl"),
+    but the log directory is listed once (os.scandir) and every later lookup
+    only filters the cached names."""
+    names = _log_dir_listing.get(log_dir)
+    if names is None:
+        try:
+            with os.scandir(log_dir) as entries:
+                # glob's '*' never matches hidden names
+                names = [e.name for e in entries if e.name.endswith('.pkl') and not e.name.startswith('.')]
+        except OSError:
+            names = []
+        _log_dir_listing[log_dir] = names
+    pattern = f"*{base_exp}*{horizon}h*{target_type}*.pkl"
+    return [f"{log_dir}/{name}" for name in fnmatch.filter(names, pattern)]
+
+
 # =====================================================================
 # SHARED HELPER: Apply y-axis cap to bar axes
 # =====================================================================
@@ -151,7 +173,7 @@ def plot_model_deterioration(target_type="Price", model_name="CatBoost", slice_l
     colors = {0: 'blue', 24: 'green', 48: 'orange', 72: 'red'}
 
     for horizon, base_exp in winners.items():
-        matching_files = glob.glob(f"{log_dir}/*{base_exp}*{horizon}h*{target_type}*.pkl")
+        matching_files = find_prediction_files(log_dir, base_exp, horizon, target_type)
         if not matching_files:
             continue
 
@@ -280,7 +302,7 @@ def plot_variance_lines(csv_file="experiment_results.csv", target_type="Price",
         lines_plotted = 0
 
         for label, base_exp in experiments_to_load.items():
-            matching_files = glob.glob(f"{log_dir}/*{base_exp}*{horizon}h*{target_type}*.pkl")
+            matching_files = find_prediction_files(log_dir, base_exp, horizon, target_type)
             if not matching_files:
                 continue
 
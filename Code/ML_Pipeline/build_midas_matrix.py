@@ -18,7 +18,6 @@ Run this BEFORE running the orchestrator. The orchestrator can
 also call this if the files are missing.
 """
 
-import json
 import sys
 import os
 from pathlib import Path
@@ -87,10 +86,9 @@ def load_midas_dataframe(json_path=MIDAS_FILE_DK1):
     if not Path(json_path).exists():
         raise FileNotFoundError(f"Midas JSON not found at {json_path}")
 
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    df = pd.DataFrame(data)
+    # Parse straight into columns (no intermediate list of dicts); keep raw JSON types and
+    # decode floats exactly like json.load (the default fast decoder can be off by an ulp)
+    df = pd.read_json(json_path, convert_dates=False, dtype=False, precise_float=True)
     print(f"  Raw Midas rows: {len(df):,}")
 
     # Parse timestamps to UTC and normalise the column name
@@ -35,7 +35,6 @@ import os
 import copy
 import shutil
 import time
-import json
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -48,6 +47,7 @@ from ML_Pipeline import config
 from ML_Pipeline import data_loader
 from ML_Pipeline import model_trainer
 from ML_Pipeline import evaluator
+from build_midas_matrix import load_midas_dataframe
 
 
 # =====================================================================
@@ -108,25 +108,7 @@ def load_and_impute_midas(json_path=MIDAS_FILE_DK1):
       2. Forward then backward fill for any remaining edge NaN, up to 12h.
       3. Column mean for any survivors.
     """
-    print(f"  Loading Midas JSON: {json_path}")
-    if not Path(json_path).exists():
-        raise FileNotFoundError(f"Midas JSON not found at {json_path}")
-
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    df = pd.DataFrame(data)
-    print(f"  Raw rows: {len(df):,}")
-
-    df['HourUTC'] = pd.to_datetime(df['datetime'], utc=True).dt.floor('h')
-    df = df.drop(columns=['datetime'])
-    df = df.sort_values('HourUTC').drop_duplicates(subset='HourUTC', keep='last').reset_index(drop=True)
-
-    df = df[['HourUTC'] + MIDAS_RAW_COLUMNS]
-    df = df.rename(columns=MIDAS_RENAME)
-
-    for col in MIDAS_RENAME.values():
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df = load_midas_dataframe(json_path)
 
     # NaN inventory BEFORE imputation
     nan_before = df.isna().sum()
@@ -37,11 +37,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Adjust these paths to match your actual file layout. Paths are
 # relative to the directory this script lives in.
 
-# Raw weather: a directory containing per-year hourly CSV files
-# (e.g. 2015_DK1_hourly.csv, 2016_DK1_hourly.csv, ...).
+# Raw weather: a directory containing per-year hourly Parquet files
+# (e.g. 2015_DK1_hourly.parquet, 2016_DK1_hourly.parquet, ...).
 # The script will concatenate every file matching WEATHER_PATTERN.
 RAW_WEATHER_DIR     = "../Data_Engineering/Data/DMI/ProcessedZones"
-RAW_WEATHER_PATTERN = "*_DK1_hourly.csv"
+RAW_WEATHER_PATTERN = "*_DK1_hourly.parquet"
 
 # Raw production & consumption: single CSV containing both DK1 and DK2.
 # The script filters to DK1 only.
@@ -303,7 +303,10 @@ def load_raw_weather():
     frames = []
     for f in files:
         try:
-            df = pd.read_csv(f, sep=None, engine='python')
+            if f.endswith('.parquet'):
+                df = pd.read_parquet(f)
+            else:
+                df = pd.read_csv(f, sep=None, engine='python')
         except Exception as e:
             print(f"    Skipping {os.path.basename(f)}: {e}")
             continue